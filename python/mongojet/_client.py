@@ -1,17 +1,11 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from bson import CodecOptions
 
 from .mongojet import core_create_client  # noqa
 
-try:
-    from typing import Unpack
-except ImportError:
-    from typing_extensions import Unpack
-
 from ._database import Database
-from ._types import DatabaseOptions, SessionOptions
-from ._codec import Codec
+from ._types import DatabaseOptions, SessionOptions, Unpack
 from ._session import ClientSession
 
 
@@ -21,10 +15,13 @@ async def create_client(url: str, tz_aware: bool = True) -> 'Client':
 
 
 class Client:
+
+    __slots__ = ('_codec_options', '_core_client', '_db_cache')
+
     def __init__(self, core_client, codec_options: CodecOptions) -> None:
         self._codec_options = codec_options
-        self._codec = Codec(options=codec_options)
         self._core_client = core_client
+        self._db_cache: Dict[str, Database] = {}
 
     def get_default_database(
         self,
@@ -38,14 +35,17 @@ class Client:
         if options:
             core_database = self._core_client.get_database_with_options(
                 default_database,
-                self._codec.encode(options),
+                options,
             )
         else:
             core_database = self._core_client.get_default_database()
 
+        if codec_options is None:
+            codec_options = self._codec_options
+
         return Database(
             core_database,
-            codec_options=codec_options or self._codec_options,
+            codec_options=codec_options,
             client=self,
         )
 
@@ -61,34 +61,39 @@ class Client:
         if options:
             core_database = self._core_client.get_database_with_options(
                 name,
-                self._codec.encode(options),
+                options,
             )
         else:
             core_database = self._core_client.get_database(name)
 
+        if codec_options is None:
+            codec_options = self._codec_options
+
         return Database(
             core_database,
-            codec_options=codec_options or self._codec_options,
+            codec_options=codec_options,
             client=self,
         )
 
     async def start_session(self, **options: Unpack[SessionOptions]) -> ClientSession:
-        core_session = await self._core_client.start_session(
-            self._codec.encode(options),
-        )
+        core_session = await self._core_client.start_session(options or None)
         return ClientSession(
             core_session,
             codec_options=self._codec_options,
         )
 
     async def close(self, immediate=True):
+        self._db_cache.clear()
         if immediate:
             await self._core_client.shutdown_immediate()
         else:
             await self._core_client.shutdown()
 
     def __getitem__(self, name: str) -> Database:
-        return self.get_database(name)
+        db = self._db_cache.get(name)
+        if db is None:
+            db = self._db_cache[name] = self.get_database(name)
+        return db
 
     def __getattr__(self, name: str) -> Database:
         if name.startswith("_"):  # pragma: no cover
@@ -96,4 +101,5 @@ class Client:
                 f"Client has no attribute {name!r}. To access the {name}"
                 f" database, use client[{name!r}]."
             )
-        return self.__getitem__(name)
+        db = self._db_cache.get(name)
+        return db if db is not None else self.__getitem__(name)
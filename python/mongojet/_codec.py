@@ -1,29 +1,70 @@
+import functools
 import re
-from typing import Any, Dict, Optional, Mapping
+import weakref
+from typing import Any, Dict, List, Optional, Mapping, Sequence, Union
 
 import bson
-from bson import CodecOptions
+from bson import CodecOptions, ObjectId
 
 DEFAULT_CODEC_OPTIONS = CodecOptions(tz_aware=True)
+# {}: document size (5) and terminating null,
+# what encode_dict returns for an empty required document
+EMPTY_DOCUMENT = b'\x05\x00\x00\x00\x00'
+# {'_id': ObjectId(...)}: document size (22), objectid type, '_id' key
+ID_QUERY_PREFIX = b'\x16\x00\x00\x00\x07_id\x00'
 
 
 class Codec:
+
+    __slots__ = ('_options', '_encode', '_decode', '_decode_all', '__weakref__')
+
     def __init__(self, options: CodecOptions):
         self._options = options
+        self._encode = functools.partial(bson.encode, codec_options=options)
+        self._decode = functools.partial(bson.decode, codec_options=options)
+        self._decode_all = functools.partial(bson.decode_all, codec_options=options)
+
+    @classmethod
+    def for_options(cls, options: CodecOptions) -> 'Codec':
+        """
+        Returns a shared codec for the given options
+        """
+        # a codec keeps its options alive, so the id can't be reused while cached
+        codec = _codecs.get(id(options))
+        if codec is None:
+            codec = _codecs[id(options)] = cls(options)
+        return codec
 
     def encode(
         self,
         doc: Optional[Mapping[str, Any]],
-        optional=True,
     ) -> Optional[bytes]:
-        if doc is None:
+        # None, or an empty document, is omitted
+        if not doc:
             return None
 
-        # if optional and doc=={}
-        if optional and not doc:
-            return None
+        return self._encode(doc)
+
+    def encode_dict(self, doc: Mapping[str, Any]) -> bytes:
+        """
+        Encodes a required document (filter, update, command, ...)
+        """
+        # None is left to bson.encode to reject
+        if not doc and doc is not None:
+            return EMPTY_DOCUMENT
 
-        return bson.BSON.encode(doc, codec_options=self._options)
+        return self._encode(doc)
+
+    @staticmethod
+    def encode_id_query(oid: ObjectId) -> bytes:
+        """
+        Encodes {'_id': oid} filter
+        """
+        return ID_QUERY_PREFIX + oid.binary + b'\x00'
+
+    def encode_many(self, docs: Sequence[Mapping[str, Any]]) -> List[bytes]:
+        encode = self._encode
+        return [encode(doc) for doc in docs]
 
     def decode(
         self,
@@ -32,9 +73,17 @@ class Codec:
         if data is None:
             return None
 
-        doc = bson.BSON(data).decode(codec_options=self._options)
+        return self._decode(data)
+
+    def decode_many(self, docs: Union[bytes, Sequence[bytes]]) -> List[Dict[str, Any]]:
+        # documents are length-prefixed, so the whole batch
+        # can be decoded by a single `decode_all` call
+        if not isinstance(docs, bytes):
+            docs = b''.join(docs)
+        return self._decode_all(docs)
+
 
-        return doc
+_codecs: 'weakref.WeakValueDictionary[int, Codec]' = weakref.WeakValueDictionary()
 
 
 def encode(
@@ -60,7 +109,7 @@ def encode(
     if amend_keys:
         doc = dict_keys_to_camel_case(doc)
 
-    return bson.BSON.encode(
+    return bson.encode(
         doc,
         codec_options=codec_options or DEFAULT_CODEC_OPTIONS,
     )
@@ -74,7 +123,8 @@ def decode(
     if data is None:
         return None
 
-    doc = bson.BSON(data).decode(
+    doc = bson.decode(
+        data,
         codec_options=codec_options or DEFAULT_CODEC_OPTIONS,
     )
 
@@ -84,6 +134,7 @@ def decode(
     return doc
 
 
+@functools.lru_cache(maxsize=1024)
 def to_camel_case(s: str) -> str:
     s = ''.join(word.capitalize() for word in s.split('_'))
     return s[:1].lower() + s[1:]
@@ -92,13 +143,14 @@ def to_camel_case(s: str) -> str:
 re_caps = re.compile(r'(?<!^)(?=[A-Z])')
 
 
+@functools.lru_cache(maxsize=1024)
 def to_snake_case(s: str) -> str:
     return re_caps.sub('_', s).lower()
 
 
 def dict_keys_to_camel_case(d: Mapping[str, Any]) -> dict:
-    return {to_camel_case(k): v for k, v in d.items()}
+    return dict(zip(map(to_camel_case, d.keys()), d.values()))
 
 
 def dict_keys_to_snake_case(d: Mapping[str, Any]) -> dict:
-    return {to_snake_case(k): v for k, v in d.items()}
+    return dict(zip(map(to_snake_case, d.keys()), d.values()))
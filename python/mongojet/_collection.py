@@ -1,13 +1,9 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Mapping, Sequence
 from typing import Any, Optional, List, Union, TYPE_CHECKING
 
-try:
-    from typing import Unpack
-except ImportError:
-    from typing_extensions import Unpack
-
 from bson import CodecOptions, ObjectId
 
 from ._session import ClientSession
@@ -45,12 +41,17 @@ from ._types import (
     WriteConcern,
     ReadConcern,
     DistinctOptions,
+    Unpack,
 )
 
 if TYPE_CHECKING:
     from ._database import Database
 
 
+# CreateIndexOptions keys, the rest of create_index kwargs describe the index
+_CREATE_INDEX_OPTIONS = ('maxTimeMS', 'comment', 'writeConcern', 'commitQuorum')
+
+
 # noinspection PyShadowingBuiltins
 class Collection:
     def __init__(
@@ -61,19 +62,29 @@ class Collection:
     ):
         self._database = database
         self._codec_options = codec_options
-        self._codec = Codec(options=codec_options)
+        self._codec = Codec.for_options(codec_options)
         self._core_collection = core_collection
 
+    def _encode_update(self, update: Union[Document, Sequence[Document]]):
+        # an update document, or an aggregation pipeline (sent as a 1-tuple);
+        # dicts are checked first, so the usual case skips the abc machinery
+        if isinstance(update, (dict, Mapping)):
+            return self._codec.encode_dict(update)
+        return (self._codec.encode_many(update),)
+
     async def find_one(
         self,
         filter: Optional[Union[Document, str]] = None,
         session: Optional[ClientSession] = None,
         **options: Unpack[FindOneOptions],
     ) -> Document:
-        if filter is not None and not isinstance(filter, Mapping):
-            filter = {'_id': filter}
+        if isinstance(filter, ObjectId):
+            filter = self._codec.encode_id_query(filter)
+        else:
+            if filter is not None and not isinstance(filter, Mapping):
+                filter = {'_id': filter}
+            filter = self._codec.encode(filter)
 
-        filter = self._codec.encode(filter)
         options = self._codec.encode(options)
 
         if session is None:
@@ -94,12 +105,9 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[FindOneAndUpdateOptions],
     ) -> Document:
-        filter = self._codec.encode(filter, optional=False)
+        filter = self._codec.encode_dict(filter)
 
-        if isinstance(update, Sequence):
-            update = ([self._codec.encode(doc) for doc in update],)
-        else:
-            update = self._codec.encode(update, optional=False)
+        update = self._encode_update(update)
 
         options = self._codec.encode(options)
 
@@ -126,8 +134,8 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[FindOneAndReplaceOptions],
     ) -> Document:
-        filter = self._codec.encode(filter, optional=False)
-        replacement = self._codec.encode(replacement, optional=False)
+        filter = self._codec.encode_dict(filter)
+        replacement = self._codec.encode_dict(replacement)
         options = self._codec.encode(options)
 
         if session is None:
@@ -152,7 +160,7 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[FindOneAndDeleteOptions],
     ) -> Document:
-        filter = self._codec.encode(filter, optional=False)
+        filter = self._codec.encode_dict(filter)
         options = self._codec.encode(options)
 
         if session is None:
@@ -186,7 +194,11 @@ class Collection:
                 filter,
                 options,
             )
-        return Cursor(cur, codec_options=self._codec_options)
+        return Cursor(
+            cur,
+            codec_options=self._codec_options,
+            prefetch=session is None,
+        )
 
     async def find_many(
         self,
@@ -206,7 +218,7 @@ class Collection:
                 options,
             )
 
-        return [self._codec.decode(d) for d in result]
+        return self._codec.decode_many(result)
 
     async def aggregate(
         self,
@@ -214,7 +226,7 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[AggregateOptions],
     ) -> Cursor[Document]:
-        pipeline = [self._codec.encode(doc) for doc in pipeline]
+        pipeline = self._codec.encode_many(pipeline)
         options = self._codec.encode(options)
 
         if session is None:
@@ -226,7 +238,11 @@ class Collection:
                 options,
             )
 
-        return Cursor(cur, codec_options=self._codec_options)
+        return Cursor(
+            cur,
+            codec_options=self._codec_options,
+            prefetch=session is None,
+        )
 
     async def update_one(
         self,
@@ -235,12 +251,9 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[UpdateOptions],
     ) -> UpdateResult:
-        filter = self._codec.encode(filter, optional=False)
+        filter = self._codec.encode_dict(filter)
 
-        if isinstance(update, Sequence):
-            update = ([self._codec.encode(doc) for doc in update],)
-        else:
-            update = self._codec.encode(update, optional=False)
+        update = self._encode_update(update)
 
         options = self._codec.encode(options)
 
@@ -266,12 +279,9 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[UpdateOptions],
     ) -> UpdateResult:
-        filter = self._codec.encode(filter, optional=False)
+        filter = self._codec.encode_dict(filter)
 
-        if isinstance(update, Sequence):
-            update = ([self._codec.encode(doc) for doc in update],)
-        else:
-            update = self._codec.encode(update, optional=False)
+        update = self._encode_update(update)
 
         options = self._codec.encode(options)
 
@@ -300,7 +310,7 @@ class Collection:
         if '_id' not in document:
             document['_id'] = ObjectId()
 
-        document = self._codec.encode(document, optional=False)
+        document = self._codec.encode_dict(document)
         options = self._codec.encode(options)
 
         if session is None:
@@ -328,7 +338,7 @@ class Collection:
             if '_id' not in document:
                 document['_id'] = ObjectId()
 
-        documents = [self._codec.encode(doc) for doc in documents]
+        documents = self._codec.encode_many(documents)
         options = self._codec.encode(options)
 
         if session is None:
@@ -352,8 +362,8 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[ReplaceOptions],
     ) -> UpdateResult:
-        filter = self._codec.encode(filter, optional=False)
-        replacement = self._codec.encode(replacement, optional=False)
+        filter = self._codec.encode_dict(filter)
+        replacement = self._codec.encode_dict(replacement)
         options = self._codec.encode(options)
 
         if session is None:
@@ -378,7 +388,7 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[DeleteOptions],
     ) -> DeleteResult:
-        filter = self._codec.encode(filter, optional=False)
+        filter = self._codec.encode_dict(filter)
         options = self._codec.encode(options)
 
         if session is None:
@@ -401,7 +411,7 @@ class Collection:
         session: Optional[ClientSession] = None,
         **options: Unpack[DeleteOptions],
     ) -> DeleteResult:
-        filter = self._codec.encode(filter, optional=False)
+        filter = self._codec.encode_dict(filter)
         options = self._codec.encode(options)
 
         if session is None:
@@ -484,15 +494,11 @@ class Collection:
         **kwargs: Any,  # IndexModelDef (wo "key") and CreateIndexOptions keys
     ) -> CreateIndexResult:
 
-        options = {}
-        if "maxTimeMS" in kwargs:
-            options["maxTimeMS"] = int(kwargs.pop("maxTimeMS"))
-        if "comment" in kwargs:
-            options["comment"] = kwargs.pop("comment")
-        if "writeConcern" in kwargs:
-            options["commitQuorum"] = kwargs.pop("commitQuorum")
-        if "commitQuorum" in kwargs:
-            options["commitQuorum"] = kwargs.pop("commitQuorum")
+        options = {
+            key: kwargs.pop(key) for key in _CREATE_INDEX_OPTIONS if key in kwargs
+        }
+        if "maxTimeMS" in options:
+            options["maxTimeMS"] = int(options["maxTimeMS"])
 
         model = IndexModel(keys, **kwargs)
 
@@ -517,7 +523,7 @@ class Collection:
         **kwargs: Unpack[CreateIndexOptions],
     ) -> CreateIndexesResult:
 
-        indexes = [self._codec.encode(idx.document) for idx in indexes]
+        indexes = self._codec.encode_many([idx.document for idx in indexes])
         options = self._codec.encode(kwargs)
 
         if session is None:
@@ -591,7 +597,7 @@ class Collection:
                 options,
             )
 
-        return [self._codec.decode(doc) for doc in docs]
+        return self._codec.decode_many(docs)
 
     async def drop(
         self,
@@ -611,17 +617,17 @@ class Collection:
                 options,
             )
 
-    @property
+    @functools.cached_property
     def read_preference(self) -> Optional[ReadPreference]:
         data = self._core_collection.read_preference()
         return self._codec.decode(data)
 
-    @property
+    @functools.cached_property
     def write_concern(self) -> Optional[WriteConcern]:
         data = self._core_collection.write_concern()
         return self._codec.decode(data)
 
-    @property
+    @functools.cached_property
     def read_concern(self) -> Optional[ReadConcern]:
         data = self._core_collection.read_concern()
         return self._codec.decode(data)
@@ -1,5 +1,7 @@
-import collections
-from typing import TypeVar, AsyncIterator, Sequence
+import asyncio
+import os
+import warnings
+from typing import TypeVar, AsyncIterator, List, Optional, Sequence
 
 from bson import CodecOptions
 
@@ -8,12 +10,57 @@ from ._codec import Codec
 T = TypeVar('T')
 
 
+def _default_batch_size(default: int = 128) -> int:
+    value = os.environ.get('MONGOJET_CURSOR_BATCH_SIZE')
+    if value is None:
+        return default
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        warnings.warn(
+            f'Invalid MONGOJET_CURSOR_BATCH_SIZE value {value!r}, '
+            f'using {default} instead',
+            RuntimeWarning,
+        )
+        return default
+    return batch_size
+
+
+DEFAULT_BATCH_SIZE = _default_batch_size()
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    # a prefetch may never be awaited (the cursor is dropped, or closed),
+    # so its error is retrieved here to keep asyncio from logging it
+    if not task.cancelled():
+        task.exception()
+
+
 class Cursor(AsyncIterator[T]):
-    def __init__(self, core_cursor, codec_options: CodecOptions, batch_size=128):
+    def __init__(
+        self,
+        core_cursor,
+        codec_options: CodecOptions,
+        batch_size: Optional[int] = None,
+        prefetch: bool = False,
+    ):
+        if batch_size is None:
+            batch_size = DEFAULT_BATCH_SIZE
+        elif batch_size < 1:
+            raise ValueError('batch_size must be a positive integer')
+
         self._core_cursor = core_cursor
-        self._codec = Codec(options=codec_options)
+        self._codec = Codec.for_options(codec_options)
         self._batch_size = batch_size
-        self._buff = collections.deque()
+        # not used for session cursors: a pending prefetch would hold the session
+        # while the caller may want to run other operations in it
+        self._prefetch = prefetch
+        self._prefetch_task: Optional[asyncio.Future] = None
+        self._buff: List[T] = []
+        self._pos = 0
+        self._closed = False
 
     def __aiter__(self):
         return self
@@ -23,14 +70,71 @@ class Cursor(AsyncIterator[T]):
     #     return self._codec.decode(data)
 
     async def __anext__(self) -> T:
-        if not self._buff:
-            docs = await self._core_cursor.next_batch(self._batch_size)
+        if self._closed:
+            raise StopAsyncIteration
+
+        if self._pos >= len(self._buff):
+            # drop the drained batch before waiting for the next one
+            self._buff = []
+            docs = await self._next_batch()
             if not docs:
                 raise StopAsyncIteration
             else:
-                self._buff.extend([self._codec.decode(doc) for doc in docs])
+                self._buff = docs
+                self._pos = 0
+
+        doc = self._buff[self._pos]
+        self._pos += 1
+        return doc
+
+    async def fetch_batch(self) -> List[T]:
+        """
+        Returns the next batch of documents (at most `batch_size` items)
+        Returns an empty list when the cursor is exhausted (or closed)
+        """
+        if self._closed:
+            return []
 
-        return self._buff.popleft()
+        if self._pos < len(self._buff):
+            docs = self._buff[self._pos :]
+            self._buff = []
+            self._pos = 0
+            return docs
+
+        return await self._next_batch()
+
+    async def _next_batch(self) -> List[T]:
+        task = self._prefetch_task
+        if task is None:
+            data = await self._core_cursor.next_batch(self._batch_size)
+        else:
+            self._prefetch_task = None
+            data = await task
+
+        docs = self._codec.decode_many(data)
+
+        # a full batch means the cursor may have more documents,
+        # so request them while the current batch is being consumed
+        if self._prefetch and len(docs) == self._batch_size:
+            task = asyncio.ensure_future(self._core_cursor.next_batch(self._batch_size))
+            task.add_done_callback(_retrieve_exception)
+            self._prefetch_task = task
+
+        return docs
+
+    async def close(self) -> None:
+        """
+        Closes the cursor: buffered and prefetched documents are dropped,
+        and no more documents are returned
+        """
+        self._closed = True
+        self._buff = []
+        self._pos = 0
+
+        task = self._prefetch_task
+        if task is not None:
+            self._prefetch_task = None
+            task.cancel()
 
     async def to_list(self, length=None) -> Sequence[T]:
         # warnings.warn(
@@ -44,4 +148,21 @@ class Cursor(AsyncIterator[T]):
                 'Only None value is supported for partial compatibility with Motor API'
             )
 
-        return [self._codec.decode(doc) for doc in await self._core_cursor.collect()]
+        if self._closed:
+            return []
+
+        # documents left in the current batch come first
+        docs = self._buff[self._pos :]
+        self._buff = []
+        self._pos = 0
+
+        task = self._prefetch_task
+        if task is not None:
+            self._prefetch_task = None
+            data = await task
+            data += await self._core_cursor.collect()
+        else:
+            data = await self._core_cursor.collect()
+
+        docs.extend(self._codec.decode_many(data))
+        return docs
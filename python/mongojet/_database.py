@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, Sequence
-
-try:
-    from typing import Unpack
-except ImportError:
-    from typing_extensions import Unpack
+import functools
+from typing import Dict, Optional, TYPE_CHECKING, Sequence
 
 from bson import CodecOptions
 
@@ -23,6 +19,7 @@ from ._types import (
     WriteConcern,
     ReadConcern,
     DropDatabaseOptions,
+    Unpack,
 )
 from ._codec import Codec
 from ._cursor import Cursor
@@ -38,8 +35,9 @@ class Database:
     def __init__(self, core_database, codec_options: CodecOptions, client: Client):
         self._client = client
         self._core_database = core_database
-        self._codec = Codec(options=codec_options)
+        self._codec = Codec.for_options(codec_options)
         self._codec_options = codec_options
+        self._collection_cache: Dict[str, Collection] = {}
 
     def get_collection(
         self,
@@ -47,17 +45,22 @@ class Database:
         codec_options: Optional[CodecOptions] = None,
         **options: Unpack[CollectionOptions],
     ) -> Collection:
+        if codec_options is None and not options:
+            return self.__getitem__(name)
 
         if options:
             core_collection = self._core_database.get_collection_with_options(
-                name, self._codec.encode(options)
+                name, options
             )
         else:
             core_collection = self._core_database.get_collection(name)
 
+        if codec_options is None:
+            codec_options = self._codec_options
+
         return Collection(
             core_collection,
-            codec_options=codec_options or self._codec_options,
+            codec_options=codec_options,
             database=self,
         )
 
@@ -100,7 +103,7 @@ class Database:
                 options,
             )
 
-        return [self._codec.decode(d) for d in result]
+        return self._codec.decode_many(result)
 
     async def run_command(
         self,
@@ -108,7 +111,7 @@ class Database:
         session: Optional[ClientSession] = None,
         **options: Unpack[RunCommandOptions],
     ) -> Document:
-        command = self._codec.encode(command, optional=False)
+        command = self._codec.encode_dict(command)
         options = self._codec.encode(options)
 
         if session is None:
@@ -128,7 +131,7 @@ class Database:
         session: Optional[ClientSession] = None,
         **options: Unpack[AggregateOptions],
     ) -> Cursor[Document]:
-        pipeline = [self._codec.encode(doc) for doc in pipeline]
+        pipeline = self._codec.encode_many(pipeline)
         options = self._codec.encode(options)
 
         if session is None:
@@ -140,7 +143,11 @@ class Database:
                 options,
             )
 
-        return Cursor(cur, codec_options=self._codec_options)
+        return Cursor(
+            cur,
+            codec_options=self._codec_options,
+            prefetch=session is None,
+        )
 
     def gridfs_bucket(
         self,
@@ -165,17 +172,17 @@ class Database:
                 options,
             )
 
-    @property
+    @functools.cached_property
     def read_preference(self) -> Optional[ReadPreference]:
         data = self._core_database.read_preference()
         return self._codec.decode(data)
 
-    @property
+    @functools.cached_property
     def write_concern(self) -> Optional[WriteConcern]:
         data = self._core_database.write_concern()
         return self._codec.decode(data)
 
-    @property
+    @functools.cached_property
     def read_concern(self) -> Optional[ReadConcern]:
         data = self._core_database.read_concern()
         return self._codec.decode(data)
@@ -189,12 +196,15 @@ class Database:
         return self._client
 
     def __getitem__(self, name: str) -> Collection:
-        core_collection = self._core_database.get_collection(name)
-        return Collection(
-            core_collection,
-            codec_options=self._codec_options,
-            database=self,
-        )
+        collection = self._collection_cache.get(name)
+        if collection is None:
+            core_collection = self._core_database.get_collection(name)
+            collection = self._collection_cache[name] = Collection(
+                core_collection,
+                codec_options=self._codec_options,
+                database=self,
+            )
+        return collection
 
     def __getattr__(self, name: str) -> Collection:
         if name.startswith("_"):  # pragma: no cover
@@ -202,4 +212,5 @@ class Database:
                 f"Database has no attribute {name!r}. To access the {name}"
                 f" collection, use database[{name!r}]."
             )
-        return self.__getitem__(name)
+        collection = self._collection_cache.get(name)
+        return collection if collection is not None else self.__getitem__(name)
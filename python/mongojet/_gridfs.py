@@ -1,85 +1,153 @@
-from typing import Any, Optional
+import functools
+from typing import Any, AsyncIterator, Optional, Union
 
-from bson import CodecOptions
+import bson
+from bson import CodecOptions, ObjectId
 
 from .mongojet import PyMongoError, NoFile, FileExists
 from ._codec import Codec
 from ._types import GridFsPutResult
 
+# file id types whose encoded {'file_id': ...} options are cached
+# (encoded the same way whatever the codec options are)
+_CACHED_FILE_ID_TYPES = (str, int, bytes)
+# {'file_id': ObjectId(...)}: document size (26), objectid type, 'file_id' key
+_FILE_ID_OID_PREFIX = b'\x1a\x00\x00\x00\x07file_id\x00'
+# upper bound of the open_download_stream chunk size (allocated for every read)
+_MAX_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=512, typed=True)
+def _encode_file_id_cached(file_id: Any) -> bytes:
+    return bson.encode({'file_id': file_id})
+
+
+def _is_duplicate_key_error(e: PyMongoError) -> bool:
+    code = getattr(e, 'code', None)
+    if code is not None:
+        return code == 11000
+    return 'E11000 duplicate key error' in str(e)
+
+
+def _is_file_not_found_error(e: PyMongoError) -> bool:
+    return 'FileNotFound' in str(e)
+
 
 class GridfsBucket:
     def __init__(self, core_bucket, codec_options: CodecOptions):
         self._core_bucket = core_bucket
-        self._codec = Codec(codec_options)
+        self._codec = Codec.for_options(codec_options)
+        self._encode = self._codec.encode
+        self._encode_dict = self._codec.encode_dict
+
+    def _encode_file_id(self, file_id: Any) -> bytes:
+        if isinstance(file_id, ObjectId):
+            return _FILE_ID_OID_PREFIX + file_id.binary + b'\x00'
+        # exact types only: subclasses (enums, ...) may be encoded differently
+        if type(file_id) in _CACHED_FILE_ID_TYPES:
+            return _encode_file_id_cached(file_id)
+        return self._encode_dict({'file_id': file_id})
 
     async def put(
         self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         filename: Optional[str] = None,
         file_id: Optional[Any] = None,
         **metadata: Any,
     ) -> GridFsPutResult:
 
-        options = {}
+        # the id is generated here, so the result doesn't have to be sent back
+        if file_id is None:
+            file_id = ObjectId()
+
         if filename:
-            options['filename'] = filename
-        if file_id:
-            options['file_id'] = file_id
+            options = self._encode_dict({'file_id': file_id, 'filename': filename})
+        else:
+            options = self._encode_file_id(file_id)
 
         # temporary hack (https://github.com/mongodb/mongo-rust-driver/issues/1071)
         try:
-            result = await self._core_bucket.put(
+            await self._core_bucket.put(
                 data,
-                self._codec.encode(options),
-                self._codec.encode(metadata),
+                options,
+                self._encode(metadata),
             )
         except PyMongoError as e:
-            if 'E11000 duplicate key error' in str(e):
+            if _is_duplicate_key_error(e):
                 raise FileExists(e) from e
             else:
                 raise
         else:
-            return self._codec.decode(result)
+            return {'file_id': file_id}
 
-    async def get_by_id(self, file_id: Any) -> bytes:
-        options = {'file_id': file_id}
+    async def get_by_id(self, file_id: Any) -> memoryview:
         # temporary hack (https://github.com/mongodb/mongo-rust-driver/issues/1071)
         try:
             result = await self._core_bucket.get_by_id(
-                self._codec.encode(options),
+                self._encode_file_id(file_id),
             )
         except PyMongoError as e:
-            if 'FileNotFound' in str(e):
+            if _is_file_not_found_error(e):
                 raise NoFile(e) from e
             else:
                 raise
         else:
-            return result
+            return memoryview(result)
+
+    async def open_download_stream(
+        self,
+        file_id: Any,
+        chunk_size: int = 255 * 1024,
+    ) -> AsyncIterator[memoryview]:
+        """
+        Yields file content by parts of (at most) `chunk_size` bytes,
+        without loading the whole file into memory
+        """
+        if not 1 <= chunk_size <= _MAX_DOWNLOAD_CHUNK_SIZE:
+            raise ValueError(
+                f'chunk_size must be between 1 and {_MAX_DOWNLOAD_CHUNK_SIZE}'
+            )
+
+        # temporary hack (https://github.com/mongodb/mongo-rust-driver/issues/1071)
+        try:
+            core_stream = await self._core_bucket.open_download_stream(
+                self._encode_file_id(file_id),
+            )
+        except PyMongoError as e:
+            if _is_file_not_found_error(e):
+                raise NoFile(e) from e
+            else:
+                raise
+
+        while True:
+            chunk = await core_stream.read(chunk_size)
+            if not len(chunk):
+                break
+            yield memoryview(chunk)
 
-    async def get_by_name(self, filename: Any) -> bytes:
+    async def get_by_name(self, filename: Any) -> memoryview:
         options = {'filename': filename}
         # temporary hack (https://github.com/mongodb/mongo-rust-driver/issues/1071)
         try:
             result = await self._core_bucket.get_by_name(
-                self._codec.encode(options),
+                self._encode(options),
             )
         except PyMongoError as e:
-            if 'FileNotFound' in str(e):
+            if _is_file_not_found_error(e):
                 raise NoFile(e) from e
             else:
                 raise
         else:
-            return result
+            return memoryview(result)
 
     async def delete(self, file_id: Any) -> None:
-        options = {'file_id': file_id}
         # temporary hack (https://github.com/mongodb/mongo-rust-driver/issues/1071)
         try:
             await self._core_bucket.delete(
-                self._codec.encode(options),
+                self._encode_file_id(file_id),
             )
         except PyMongoError as e:
-            if 'FileNotFound' in str(e):
+            if _is_file_not_found_error(e):
                 raise NoFile(e) from e
             else:
                 raise
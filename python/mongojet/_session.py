@@ -2,25 +2,24 @@ from __future__ import annotations
 
 from bson import CodecOptions
 
-try:
-    from typing import Unpack
-except ImportError:
-    from typing_extensions import Unpack
-
-from ._types import TransactionOptions
+from ._types import TransactionOptions, Unpack
 from ._codec import Codec
 
 
 class ClientSession:
+
+    __slots__ = ('_core_session', '_codec', '_encode')
+
     def __init__(self, core_session, codec_options: CodecOptions):
         self._core_session = core_session
-        self._codec = Codec(options=codec_options)
+        self._codec = Codec.for_options(codec_options)
+        self._encode = self._codec.encode
 
     async def start_transaction(
         self,
         **options: Unpack[TransactionOptions],
     ) -> _TransactionContext:
-        await self._core_session.start_transaction(self._codec.encode(options))
+        await self._core_session.start_transaction(self._encode(options))
         return _TransactionContext(self)
 
     async def commit_transaction(self):
@@ -35,6 +34,9 @@ class ClientSession:
 
 
 class _TransactionContext:
+
+    __slots__ = ('_session',)
+
     def __init__(self, session: ClientSession):
         self._session = session
 
@@ -1,3 +1,4 @@
+import functools
 from enum import IntEnum
 from typing import (
     TypedDict,
@@ -12,9 +13,9 @@ from typing import (
 )
 
 try:
-    from typing import Required
+    from typing import Required, Unpack  # noqa: F401
 except ImportError:
-    from typing_extensions import Required
+    from typing_extensions import Required, Unpack  # noqa: F401
 
 Document = Dict[str, Any]
 
@@ -374,14 +375,72 @@ Sort = IndexList
 IndexKeys = Union[str, IndexList]
 
 
+_INDEX_OPTION_TYPES = (str, int, bool, float)
+
+
+def _index_model_cache_key(keys: IndexKeys, kwargs: Dict[str, Any]) -> Any:
+    """
+    Returns a hashable key for IndexModel arguments, or None if they can't be cached
+    Value types are part of the key, so that e.g. 1 and True don't collide
+    """
+    if type(keys) is str:
+        keys_key: Any = keys
+    else:
+        if type(keys) is dict:
+            items = keys.items()
+        elif type(keys) in (list, tuple):
+            items = keys
+        else:
+            return None
+
+        keys_key = []
+        for item in items:
+            if type(item) is str:
+                keys_key.append(item)
+            elif (
+                type(item) is tuple
+                and len(item) == 2
+                and type(item[0]) is str
+                and type(item[1]) in (int, str)
+            ):
+                keys_key.append((item[0], type(item[1]), item[1]))
+            else:
+                return None
+        keys_key = tuple(keys_key)
+
+    options_key = []
+    for name, value in kwargs.items():
+        if type(value) not in _INDEX_OPTION_TYPES:
+            return None
+        options_key.append((name, type(value), value))
+
+    return keys_key, tuple(options_key)
+
+
+@functools.lru_cache(maxsize=256)
+def _create_index_model_cached(keys: Any, options: Tuple[Any, ...]) -> IndexModelDef:
+    from ._helpers import create_index_model
+
+    if type(keys) is tuple:
+        keys = [item if type(item) is str else (item[0], item[2]) for item in keys]
+
+    return create_index_model(keys, **{name: value for name, _, value in options})
+
+
 class IndexModel:
 
     __slots__ = ("__document",)
 
     def __init__(self, keys: IndexKeys, **kwargs: Any) -> None:
-        from ._helpers import create_index_model
-
-        self.__document = create_index_model(keys, **kwargs)
+        cache_key = _index_model_cache_key(keys, kwargs)
+        if cache_key is None:
+            from ._helpers import create_index_model
+
+            self.__document = create_index_model(keys, **kwargs)
+        else:
+            # copied, as the document is exposed to the caller
+            document = _create_index_model_cached(*cache_key)
+            self.__document = {**document, 'key': dict(document['key'])}
 
     @property
     def document(self) -> IndexModelDef:
@@ -15,7 +15,9 @@ use mongodb::{Collection, IndexModel};
 use pyo3::prelude::*;
 
 use crate::cursor::{CoreCursor, CoreSessionCursor};
-use crate::document::{CoreCompoundDocument, CoreDocument, CorePipeline, CoreRawDocument};
+use crate::document::{
+    CoreCompoundDocument, CoreDocument, CorePipeline, CoreRawDocument, CoreRawDocumentList,
+};
 use crate::result::{
     CoreCreateIndexResult, CoreCreateIndexesResult, CoreDeleteResult, CoreDistinctResult,
     CoreInsertManyResult, CoreInsertOneResult, CoreUpdateResult, ReadConcernResult,
@@ -375,7 +377,7 @@ impl CoreCollection {
         &self,
         filter: Option<CoreDocument>,
         options: Option<CoreFindOptions>,
-    ) -> PyResult<Vec<CoreRawDocument>> {
+    ) -> PyResult<CoreRawDocumentList> {
         let collection = self.collection.clone();
 
         let filter: Option<Document> = filter.map(Into::into);
@@ -387,18 +389,15 @@ impl CoreCollection {
         );
 
         let fut = async move {
-            let docs: Vec<CoreRawDocument> = collection
+            let docs: Vec<RawDocumentBuf> = collection
                 .find(filter, options)
                 .await
                 .map_err(|e| MongoError::from(e))?
                 .try_collect::<Vec<_>>()
                 .await
-                .map_err(|e| MongoError::from(e))?
-                .into_iter()
-                .map(CoreRawDocument::from)
-                .collect();
+                .map_err(|e| MongoError::from(e))?;
 
-            Ok(docs)
+            Ok(docs.into())
         };
 
         spawn(fut).await?
@@ -409,7 +408,7 @@ impl CoreCollection {
         session: Py<CoreSession>,
         filter: Option<CoreDocument>,
         options: Option<CoreFindOptions>,
-    ) -> PyResult<Vec<CoreRawDocument>> {
+    ) -> PyResult<CoreRawDocumentList> {
         let collection = self.collection.clone();
 
         let filter: Option<Document> = filter.map(Into::into);
@@ -425,19 +424,16 @@ impl CoreCollection {
         let fut = async move {
             let mut session = session.lock().await;
 
-            let docs: Vec<CoreRawDocument> = collection
+            let docs: Vec<RawDocumentBuf> = collection
                 .find_with_session(filter, options, &mut session.deref_mut())
                 .await
                 .map_err(|e| MongoError::from(e))?
                 .stream(&mut session.deref_mut())
                 .try_collect::<Vec<_>>()
                 .await
-                .map_err(|e| MongoError::from(e))?
-                .into_iter()
-                .map(CoreRawDocument::from)
-                .collect();
+                .map_err(|e| MongoError::from(e))?;
 
-            Ok(docs)
+            Ok(docs.into())
         };
 
         spawn(fut).await?
@@ -1,8 +1,21 @@
+use bson::{Bson, Document};
+use pyo3::exceptions::PyTypeError;
+use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyDict, PyFloat, PyList, PyLong, PyString, PyTuple};
+
 #[rustfmt::skip]
 macro_rules! from_py_object {
     ($t:ident) => {
         impl<'py> FromPyObject<'py> for $t {
             fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+                // small option dicts are accepted as is, without bson encoding on python side
+                if let Ok(dict) = ob.downcast::<pyo3::types::PyDict>() {
+                    let doc = crate::conv::py_dict_to_document(dict)?;
+                    let result = bson::from_document(doc)
+                        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+                    return Ok(result);
+                }
+
                 let bytes = ob.extract::<&[u8]>()?;
                 let result = bson::from_slice(bytes)
                     .map_err(|e| PyValueError::new_err(e.to_string()))?;
@@ -30,3 +43,50 @@ macro_rules! into_py_object {
 
 pub(crate) use from_py_object;
 pub(crate) use into_py_object;
+
+/// Converts plain python values (None, bool, int, float, str, dict, list, tuple) into bson.
+/// Anything else (ObjectId, datetime, ...) must go through python `bson` encoding instead
+pub fn py_to_bson(ob: &Bound<'_, PyAny>) -> PyResult<Bson> {
+    if ob.is_none() {
+        return Ok(Bson::Null);
+    }
+    if let Ok(value) = ob.downcast::<PyBool>() {
+        return Ok(Bson::Boolean(value.is_true()));
+    }
+    if ob.is_instance_of::<PyLong>() {
+        let value: i64 = ob.extract()?;
+        return Ok(match i32::try_from(value) {
+            Ok(value) => Bson::Int32(value),
+            Err(_) => Bson::Int64(value),
+        });
+    }
+    if let Ok(value) = ob.downcast::<PyFloat>() {
+        return Ok(Bson::Double(value.value()));
+    }
+    if ob.is_instance_of::<PyString>() {
+        return Ok(Bson::String(ob.extract::<String>()?));
+    }
+    if let Ok(dict) = ob.downcast::<PyDict>() {
+        return Ok(Bson::Document(py_dict_to_document(dict)?));
+    }
+    if ob.is_instance_of::<PyList>() || ob.is_instance_of::<PyTuple>() {
+        let mut items = Vec::new();
+        for item in ob.iter()? {
+            items.push(py_to_bson(&item?)?);
+        }
+        return Ok(Bson::Array(items));
+    }
+
+    Err(PyTypeError::new_err(format!(
+        "Couldn't convert value to bson: {}",
+        ob
+    )))
+}
+
+pub fn py_dict_to_document(dict: &Bound<'_, PyDict>) -> PyResult<Document> {
+    let mut doc = Document::new();
+    for (key, value) in dict.iter() {
+        doc.insert(key.extract::<String>()?, py_to_bson(&value)?);
+    }
+    Ok(doc)
+}
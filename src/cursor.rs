@@ -8,7 +8,7 @@ use pyo3::exceptions::PyStopAsyncIteration;
 use pyo3::prelude::*;
 use tokio::sync::Mutex;
 
-use crate::document::CoreRawDocument;
+use crate::document::{CoreRawDocument, CoreRawDocumentList};
 use crate::error::MongoError;
 use crate::runtime::spawn;
 
@@ -48,27 +48,27 @@ impl CoreCursor {
         spawn(fut).await?
     }
 
-    pub async fn collect(&mut self) -> PyResult<Vec<CoreRawDocument>> {
+    pub async fn collect(&mut self) -> PyResult<CoreRawDocumentList> {
         let cursor = Arc::clone(&self.cursor);
 
         let fut = async move {
-            let mut result: Vec<CoreRawDocument> = Vec::new();
+            let mut result: Vec<RawDocumentBuf> = Vec::new();
             let mut cursor = cursor.lock().await;
 
             while let Some(doc) = cursor.try_next().await.map_err(|e| MongoError::from(e))? {
-                result.push(doc.into());
+                result.push(doc);
             }
 
-            Ok(result)
+            Ok(result.into())
         };
 
         spawn(fut).await?
     }
 
-    pub async fn next_batch(&mut self, batch_size: u64) -> PyResult<Vec<CoreRawDocument>> {
+    pub async fn next_batch(&mut self, batch_size: u64) -> PyResult<CoreRawDocumentList> {
         let cursor = Arc::clone(&self.cursor);
         let fut = async move {
-            let mut result = Vec::with_capacity(batch_size as usize);
+            let mut result: Vec<RawDocumentBuf> = Vec::with_capacity(batch_size as usize);
             let mut cursor = cursor.lock().await;
 
             for _ in 0..batch_size {
@@ -78,15 +78,14 @@ impl CoreCursor {
                     break;
                 }
 
-                let doc: CoreRawDocument = cursor
+                let doc = cursor
                     .deserialize_current()
-                    .map_err(|e| MongoError::from(e))?
-                    .into();
+                    .map_err(|e| MongoError::from(e))?;
 
                 result.push(doc);
             }
 
-            Ok(result)
+            Ok(result.into())
         };
 
         spawn(fut).await?
@@ -134,12 +133,12 @@ impl CoreSessionCursor {
         spawn(fut).await?
     }
 
-    pub async fn next_batch(&mut self, batch_size: u64) -> PyResult<Vec<CoreRawDocument>> {
+    pub async fn next_batch(&mut self, batch_size: u64) -> PyResult<CoreRawDocumentList> {
         let cursor = Arc::clone(&self.cursor);
         let session = Arc::clone(&self.session);
 
         let fut = async move {
-            let mut result: Vec<CoreRawDocument> = Vec::with_capacity(batch_size as usize);
+            let mut result: Vec<RawDocumentBuf> = Vec::with_capacity(batch_size as usize);
 
             let mut cursor = cursor.lock().await;
             let mut session = session.lock().await;
@@ -151,24 +150,24 @@ impl CoreSessionCursor {
                     .transpose()
                     .map_err(|e| MongoError::from(e))?
                 {
-                    result.push(doc.into());
+                    result.push(doc);
                 } else {
                     break;
                 }
             }
 
-            return Ok(result);
+            return Ok(result.into());
         };
 
         spawn(fut).await?
     }
 
-    pub async fn collect(&mut self) -> PyResult<Vec<CoreRawDocument>> {
+    pub async fn collect(&mut self) -> PyResult<CoreRawDocumentList> {
         let cursor = Arc::clone(&self.cursor);
         let session = Arc::clone(&self.session);
 
         let fut = async move {
-            let mut result: Vec<CoreRawDocument> = Vec::new();
+            let mut result: Vec<RawDocumentBuf> = Vec::new();
 
             let mut cursor = cursor.lock().await;
             let mut session = session.lock().await;
@@ -179,10 +178,10 @@ impl CoreSessionCursor {
                 .transpose()
                 .map_err(|e| MongoError::from(e))?
             {
-                result.push(doc.into());
+                result.push(doc);
             }
 
-            return Ok(result);
+            return Ok(result.into());
         };
 
         spawn(fut).await?
@@ -140,3 +140,32 @@ impl<'a> FromPyObject<'a> for CoreRawDocument {
         Ok(CoreRawDocument(doc))
     }
 }
+
+#[derive(Debug, Clone, Default)]
+pub struct CoreRawDocumentList(Vec<RawDocumentBuf>);
+
+impl From<Vec<RawDocumentBuf>> for CoreRawDocumentList {
+    fn from(value: Vec<RawDocumentBuf>) -> Self {
+        Self(value)
+    }
+}
+
+impl IntoPy<PyObject> for CoreRawDocumentList {
+    fn into_py(self, py: Python<'_>) -> PyObject {
+        // bson documents are length-prefixed, so the whole list is passed to python
+        // as a single bytes object which can be decoded by one `bson.decode_all` call
+        let len = self.0.iter().map(|doc| doc.as_bytes().len()).sum();
+
+        PyBytes::new_bound_with(py, len, |buf| {
+            let mut offset = 0;
+            for doc in self.0.iter() {
+                let data = doc.as_bytes();
+                buf[offset..offset + data.len()].copy_from_slice(data);
+                offset += data.len();
+            }
+            Ok(())
+        })
+        .expect("Couldn't allocate bytes for bson documents")
+        .to_object(py)
+    }
+}
@@ -1,8 +1,11 @@
+use std::collections::HashSet;
 use std::fmt::{Display, Formatter};
+use std::marker::PhantomData;
 
 use mongodb::error::{ErrorKind, WriteFailure};
 use pyo3::exceptions::{PyException, PyValueError};
-use pyo3::{create_exception, PyErr};
+use pyo3::prelude::*;
+use pyo3::{create_exception, PyErr, PyErrArguments, PyTypeInfo};
 
 create_exception!(
     mongojet,
@@ -105,39 +108,95 @@ impl From<mongodb::error::Error> for MongoError {
     }
 }
 
+impl MongoError {
+    /// Server error code, if the error was reported by the server
+    fn code(&self) -> Option<i32> {
+        match *self.0.kind {
+            ErrorKind::Command(ref cmd) => Some(cmd.code),
+            ErrorKind::Write(WriteFailure::WriteError(ref w)) => Some(w.code),
+            ErrorKind::Write(WriteFailure::WriteConcernError(ref w)) => Some(w.code),
+            _ => None,
+        }
+    }
+}
+
 impl From<MongoError> for PyErr {
     fn from(value: MongoError) -> Self {
+        let code = value.code();
+        let labels: HashSet<String> = value.0.labels().clone();
         let msg = value.clone().to_string();
+        let args = ErrorArgs { msg, code, labels };
+
         match *value.0.kind {
-            // ErrorKind::InvalidArgument { .. } => ConfigurationError::new_err(msg),
-            ErrorKind::InvalidArgument { .. } => PyValueError::new_err(msg),
-            ErrorKind::Authentication { .. } => ConfigurationError::new_err(msg),
-            ErrorKind::BsonSerialization(..) => BsonSerializationError::new_err(msg),
-            ErrorKind::BsonDeserialization(..) => BsonDeserializationError::new_err(msg),
-            ErrorKind::ServerSelection { .. } => ServerSelectionError::new_err(msg),
+            // ErrorKind::InvalidArgument { .. } => args.into_err::<ConfigurationError>(),
+            ErrorKind::InvalidArgument { .. } => args.into_err::<PyValueError>(),
+            ErrorKind::Authentication { .. } => args.into_err::<ConfigurationError>(),
+            ErrorKind::BsonSerialization(..) => args.into_err::<BsonSerializationError>(),
+            ErrorKind::BsonDeserialization(..) => args.into_err::<BsonDeserializationError>(),
+            ErrorKind::ServerSelection { .. } => args.into_err::<ServerSelectionError>(),
             ErrorKind::Write(failure) => match failure {
-                WriteFailure::WriteConcernError(_) => WriteConcernError::new_err(msg),
+                WriteFailure::WriteConcernError(_) => args.into_err::<WriteConcernError>(),
                 WriteFailure::WriteError(w) => {
                     //todo: more specific error for different error codes
                     if w.code == 11000 {
-                        DuplicateKeyError::new_err(msg)
+                        args.into_err::<DuplicateKeyError>()
                     } else {
-                        WriteError::new_err(msg)
+                        args.into_err::<WriteError>()
                     }
                 }
-                _ => WriteError::new_err(msg),
+                _ => args.into_err::<WriteError>(),
             },
-            ErrorKind::BulkWrite(..) => WriteError::new_err(msg),
+            ErrorKind::BulkWrite(..) => args.into_err::<WriteError>(),
             ErrorKind::Command(..) => {
                 //todo: more specific error for different error codes
                 // if cmd.code == 85{
-                OperationFailure::new_err(msg)
+                args.into_err::<OperationFailure>()
             }
             //todo
             //error[E0603]: tuple variant `GridFs` is private
             // https://github.com/mongodb/mongo-rust-driver/issues/1071
-            // ErrorKind::GridFs(..) => GridFSError::new_err(msg),
-            _ => PyMongoError::new_err(msg),
+            // ErrorKind::GridFs(..) => args.into_err::<GridFSError>(),
+            _ => args.into_err::<PyMongoError>(),
+        }
+    }
+}
+
+/// Error message, code and labels of a python exception which is created lazily,
+/// so an error raised on a runtime thread doesn't have to wait for the GIL
+struct ErrorArgs {
+    msg: String,
+    code: Option<i32>,
+    labels: HashSet<String>,
+}
+
+impl ErrorArgs {
+    fn into_err<T: PyTypeInfo + 'static>(self) -> PyErr {
+        PyErr::new::<T, _>(LazyError::<T> {
+            args: self,
+            exc_type: PhantomData,
+        })
+    }
+}
+
+struct LazyError<T> {
+    args: ErrorArgs,
+    exc_type: PhantomData<fn() -> T>,
+}
+
+impl<T: PyTypeInfo> PyErrArguments for LazyError<T> {
+    fn arguments(self, py: Python<'_>) -> PyObject {
+        let ErrorArgs { msg, code, labels } = self.args;
+
+        // the exception instance is created here, with the GIL held, so that
+        // code and labels can be exposed (errors can be classified without parsing
+        // messages); an instance of the exception type is raised as it is
+        match T::type_object_bound(py).call1((msg.clone(),)) {
+            Ok(exc) => {
+                let _ = exc.setattr("code", code);
+                let _ = exc.setattr("labels", labels);
+                exc.unbind()
+            }
+            Err(_) => msg.into_py(py),
         }
     }
 }
@@ -2,13 +2,125 @@ use crate::document::CoreDocument;
 use crate::error::MongoError;
 use crate::options::{CoreGridFsGetByIdOptions, CoreGridFsGetByNameOptions, CoreGridFsPutOptions};
 use crate::runtime::spawn;
-use bson::{doc, Document};
+use bson::Document;
 use futures::{AsyncReadExt, AsyncWriteExt};
 use log::debug;
 use mongodb::options::GridFsUploadOptions;
-use mongodb::GridFsBucket;
+use mongodb::{GridFsBucket, GridFsDownloadStream};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyBufferError, PyMemoryError};
+use pyo3::ffi;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use std::ffi::CStr;
+use std::os::raw::{c_int, c_void};
+use std::ptr;
+use std::sync::Arc;
+use tokio::sync::Mutex;
+
+/// Downloaded file content, exposed to python through the buffer protocol
+/// so the data is not copied into a bytes object
+#[pyclass(frozen)]
+pub struct CoreGridFsData {
+    data: Vec<u8>,
+}
+
+#[pymethods]
+impl CoreGridFsData {
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("View is null"));
+        }
+
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("Object is not writable"));
+        }
+
+        let data = &slf.get().data;
+
+        (*view).obj = slf.clone().into_any().into_ptr();
+        (*view).buf = data.as_ptr() as *mut c_void;
+        (*view).len = data.len() as isize;
+        (*view).readonly = 1;
+        (*view).itemsize = 1;
+
+        (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+            CStr::from_bytes_with_nul(b"B\0").unwrap().as_ptr() as *mut _
+        } else {
+            ptr::null_mut()
+        };
+
+        (*view).ndim = 1;
+        (*view).shape = if (flags & ffi::PyBUF_ND) == ffi::PyBUF_ND {
+            &mut (*view).len
+        } else {
+            ptr::null_mut()
+        };
+
+        (*view).strides = if (flags & ffi::PyBUF_STRIDES) == ffi::PyBUF_STRIDES {
+            &mut (*view).itemsize
+        } else {
+            ptr::null_mut()
+        };
+
+        (*view).suboffsets = ptr::null_mut();
+        (*view).internal = ptr::null_mut();
+
+        Ok(())
+    }
+
+    unsafe fn __releasebuffer__(&self, _view: *mut ffi::Py_buffer) {}
+
+    fn __len__(&self) -> usize {
+        self.data.len()
+    }
+}
+
+#[pyclass]
+pub struct CoreGridFsDownloadStream {
+    stream: Arc<Mutex<GridFsDownloadStream>>,
+}
+
+#[pymethods]
+impl CoreGridFsDownloadStream {
+    /// Reads up to `size` bytes, returns empty data at the end of the file
+    pub async fn read(&mut self, size: usize) -> PyResult<CoreGridFsData> {
+        let stream = Arc::clone(&self.stream);
+
+        let fut = async move {
+            let mut stream = stream.lock().await;
+            let mut buf = Vec::new();
+            buf.try_reserve_exact(size)
+                .map_err(|_| PyMemoryError::new_err("Can't allocate the read buffer"))?;
+            buf.resize(size, 0u8);
+            let mut filled = 0;
+
+            while filled < size {
+                let n = stream
+                    .read(&mut buf[filled..])
+                    .await
+                    .map_err(|e| MongoError::from(e))?;
+
+                if n == 0 {
+                    break;
+                }
+
+                filled += n;
+            }
+
+            // the data outlives this call (behind a memoryview),
+            // so a short (last) read must not keep the whole buffer allocated
+            buf.truncate(filled);
+            buf.shrink_to_fit();
+            Ok(CoreGridFsData { data: buf })
+        };
+
+        spawn(fut).await?
+    }
+}
 
 #[pyclass]
 pub struct CoreGridFsBucket {
@@ -25,10 +137,22 @@ impl CoreGridFsBucket {
 impl CoreGridFsBucket {
     pub async fn put(
         &self,
-        data: Vec<u8>,
+        data: PyBuffer<u8>,
         options: Option<CoreGridFsPutOptions>,
         metadata: Option<CoreDocument>,
-    ) -> PyResult<CoreDocument> {
+    ) -> PyResult<()> {
+        if !data.is_c_contiguous() {
+            return Err(PyBufferError::new_err("data must be a contiguous buffer"));
+        }
+
+        // a writable buffer (bytearray, ...) can be changed from python while
+        // it's being uploaded, so it's copied; a read-only one is read in place
+        let copied: Option<Vec<u8>> = if data.readonly() {
+            None
+        } else {
+            Some(Python::with_gil(|py| data.to_vec(py))?)
+        };
+
         let bucket = self.bucket.clone();
 
         debug!(
@@ -50,8 +174,18 @@ impl CoreGridFsBucket {
                 bucket.open_upload_stream(filename, upload_options)
             };
 
+            // a read-only buffer stays exported (so it's neither freed nor changed)
+            // until `data` is dropped at the end of the upload
+            let bytes: &[u8] = match &copied {
+                Some(copied) => copied.as_slice(),
+                None if data.len_bytes() == 0 => &[],
+                None => unsafe {
+                    std::slice::from_raw_parts(data.buf_ptr() as *const u8, data.len_bytes())
+                },
+            };
+
             upload_stream
-                .write_all(&data[..])
+                .write_all(bytes)
                 .await
                 .map_err(|e| MongoError::from(e))?;
 
@@ -60,14 +194,13 @@ impl CoreGridFsBucket {
                 .await
                 .map_err(|e| MongoError::from(e))?;
 
-            let result: CoreDocument = doc! {"file_id": upload_stream.id()}.into();
-            Ok(result)
+            Ok(())
         };
 
         spawn(fut).await?
     }
 
-    pub async fn get_by_id(&self, options: CoreGridFsGetByIdOptions) -> PyResult<PyObject> {
+    pub async fn get_by_id(&self, options: CoreGridFsGetByIdOptions) -> PyResult<CoreGridFsData> {
         let bucket = self.bucket.clone();
 
         debug!("gridfs.get_by_id, options: {:?}", options);
@@ -85,8 +218,31 @@ impl CoreGridFsBucket {
                 .await
                 .map_err(|e| MongoError::from(e))?;
 
-            // Python::with_gil(|py|{ Ok(buf.into_py(py)) })
-            Python::with_gil(|py| Ok(PyBytes::new_bound(py, &buf).to_object(py)))
+            Ok(CoreGridFsData { data: buf })
+        };
+
+        spawn(fut).await?
+    }
+
+    pub async fn open_download_stream(
+        &self,
+        options: CoreGridFsGetByIdOptions,
+    ) -> PyResult<CoreGridFsDownloadStream> {
+        let bucket = self.bucket.clone();
+
+        debug!("gridfs.open_download_stream, options: {:?}", options);
+
+        let file_id = options.file_id;
+
+        let fut = async move {
+            let download_stream = bucket
+                .open_download_stream(file_id)
+                .await
+                .map_err(|e| MongoError::from(e))?;
+
+            Ok(CoreGridFsDownloadStream {
+                stream: Arc::new(Mutex::new(download_stream)),
+            })
         };
 
         spawn(fut).await?
@@ -95,7 +251,7 @@ impl CoreGridFsBucket {
     pub async fn get_by_name<'py>(
         &self,
         options: CoreGridFsGetByNameOptions,
-    ) -> PyResult<PyObject> {
+    ) -> PyResult<CoreGridFsData> {
         let bucket = self.bucket.clone();
 
         debug!("gridfs.get_by_name, options: {:?}", options);
@@ -113,7 +269,7 @@ impl CoreGridFsBucket {
                 .await
                 .map_err(|e| MongoError::from(e))?;
 
-            Python::with_gil(|py| Ok(PyBytes::new_bound(py, &buf).to_object(py)))
+            Ok(CoreGridFsData { data: buf })
         };
 
         spawn(fut).await?
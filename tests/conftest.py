@@ -1,17 +1,45 @@
+import os
+
+import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 
 from mongojet import create_client
 
 
+def pytest_collection_modifyitems(items):
+    # run every test in the session loop the shared client was created in
+    session_scope_marker = pytest.mark.asyncio(scope='session')
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
 @pytest_asyncio.fixture(scope='session')
 async def client():
     c = await create_client('mongodb://127.0.0.1:27117/test_db?replicaSet=rs1')
+    # establish a pooled connection before the first test runs
+    await c['admin'].run_command({'ping': 1})
     yield c
     await c.close()
 
 
 @pytest_asyncio.fixture(scope='session')
 async def db(client):
-    db = client.get_default_database()
+    # under pytest-xdist every worker gets a database of its own
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker is None:
+        db = client.get_default_database()
+    else:
+        db = client.get_database(f'test_db_{worker}')
+    await db.drop()
+    yield db
     await db.drop()
-    return db
+
+
+@pytest_asyncio.fixture(scope='session')
+async def shared_collection(db):
+    # read-only corpus shared by the querying tests: [{'a': 0}, ..., {'a': 9}]
+    collection = db['test_shared_range']
+    await collection.insert_many([{'a': i} for i in range(10)])
+    return collection
@@ -0,0 +1,18 @@
+import pytest
+
+from mongojet._codec import to_camel_case
+
+
+@pytest.mark.parametrize(
+    'name, expected',
+    [
+        ('max_time_ms', 'maxTimeMs'),
+        ('comment', 'comment'),
+        ('_id', 'id'),
+        ('foo__bar', 'fooBar'),
+        ('ABC_def', 'abcDef'),
+        ('', ''),
+    ],
+)
+def test_to_camel_case(name: str, expected: str):
+    assert to_camel_case(name) == expected
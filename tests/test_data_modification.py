@@ -57,8 +57,10 @@ async def test_insert_error(db: Database):
     await collection.create_index('foo', unique=True)
 
     await collection.insert_one({'foo': 'bar'})
-    with pytest.raises(DuplicateKeyError):
+    with pytest.raises(DuplicateKeyError) as exc_info:
         await collection.insert_one({'foo': 'bar'})
+    assert exc_info.value.code == 11000
+    assert isinstance(exc_info.value.labels, set)
 
 
 @pytest.mark.asyncio
@@ -139,11 +141,7 @@ async def test_update_one(db: Database):
 @pytest.mark.asyncio
 async def test_update_many(db: Database):
     collection = db['test_update_many']
-    await collection.insert_one({'a': 1})
-    await collection.insert_one({'a': 2})
-    await collection.insert_one({'a': 3})
-    await collection.insert_one({'a': 4})
-    await collection.insert_one({'a': 5})
+    await collection.insert_many([{'a': i} for i in range(1, 6)])
 
     res = await collection.update_many(
         filter={'a': {'$gte': 3}},
@@ -168,6 +166,32 @@ async def test_update_many(db: Database):
     assert await collection.count_documents() == 6
 
 
+@pytest.mark.asyncio
+async def test_update_with_pipeline(db: Database):
+    collection = db['test_update_with_pipeline']
+    res = await collection.insert_one({'a': 1, 'b': 2})
+    inserted_id = res['inserted_id']
+
+    res = await collection.update_one(
+        filter={'_id': inserted_id},
+        update=[{'$set': {'c': {'$add': ['$a', '$b']}}}, {'$unset': 'b'}],
+    )
+    assert res['matched_count'] == 1
+    assert res['modified_count'] == 1
+    assert await collection.find_one(inserted_id) == {
+        '_id': inserted_id,
+        'a': 1,
+        'c': 3,
+    }
+
+    doc = await collection.find_one_and_update(
+        filter={'_id': inserted_id},
+        update=[{'$set': {'a': {'$multiply': ['$c', 10]}}}],
+        return_document='after',
+    )
+    assert doc == {'_id': inserted_id, 'a': 30, 'c': 3}
+
+
 @pytest.mark.asyncio
 async def test_find_and_modify(db: Database):
     collection = db['test_find_and_modify']
@@ -246,3 +270,7 @@ async def test_delete_many(db: Database):
     res = await collection.delete_many(filter={'a': {'$gte': 3}})
     assert res['deleted_count'] == 2
     assert await collection.count_documents() == 3
+
+    res = await collection.delete_many(filter={})
+    assert res['deleted_count'] == 3
+    assert await collection.count_documents() == 0
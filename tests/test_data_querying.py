@@ -1,10 +1,14 @@
+import asyncio
 import itertools
 import re
 
 import pytest
 from bson import SON
 
-from mongojet import Database
+from mongojet import Collection, Database
+
+_REGEX_VALUES = ('Foo', 'Bar', 'Baz', 'Qux', 'Fred')
+_CASE_INSENSITIVE_BA = re.compile(r'^ba', re.IGNORECASE)
 
 
 @pytest.mark.asyncio
@@ -15,10 +19,13 @@ async def test_find_one(db: Database):
     inserted_id = res['inserted_id']
     inserted_doc = {'_id': inserted_id, **inserted_data}
 
-    doc = await collection.find_one({'_id': inserted_id})
-    assert doc == inserted_doc
-
-    doc = await collection.find_one({'_id': inserted_id}, projection={'a': 1})
+    doc1, doc2, doc = await asyncio.gather(
+        collection.find_one({'_id': inserted_id}),
+        collection.find_one(inserted_id),
+        collection.find_one({'_id': inserted_id}, projection={'a': 1}),
+    )
+    assert doc1 == inserted_doc
+    assert doc2 == inserted_doc
     assert 'a' in doc
     assert 'b' not in doc
 
@@ -26,66 +33,63 @@ async def test_find_one(db: Database):
 @pytest.mark.asyncio
 async def test_distinct(db: Database):
     collection = db['test_distinct']
-    await collection.insert_many([{'foo': 'bar', 'a': 1} for _ in range(3)])
-    await collection.insert_many([{'foo': 'baz', 'a': 2} for _ in range(3)])
-    await collection.insert_many([{'foo': 'qux', 'a': 3} for _ in range(3)])
-
-    assert await collection.count_documents() == 9
-
-    res = await collection.distinct('foo')
-    assert sorted(res) == sorted(['bar', 'baz', 'qux'])
+    pairs = [('bar', 1), ('baz', 2), ('qux', 3)]
+    await collection.insert_many(
+        [{'foo': foo, 'a': a} for foo, a in pairs for _ in range(3)]
+    )
 
-    res = await collection.distinct('a', filter={'foo': 'bar'})
-    assert sorted(res) == [1]
+    count, res1, res2 = await asyncio.gather(
+        collection.count_documents(),
+        collection.distinct('foo'),
+        collection.distinct('a', filter={'foo': 'bar'}),
+    )
+    assert count == 9
+    assert sorted(res1) == sorted(['bar', 'baz', 'qux'])
+    assert sorted(res2) == [1]
 
 
 @pytest.mark.asyncio
-async def test_find_many_sort(db: Database):
-    collection = db['test_find_many_sort']
-    values = [i for i in range(5)]
-    await collection.insert_many([{'a': i} for i in values])
-
-    docs = await collection.find_many(sort={'a': 1})
-    assert sorted(values) == [doc['a'] for doc in docs]
-
-    docs = await collection.find_many(sort={'a': -1})
-    assert sorted(values, reverse=True) == [doc['a'] for doc in docs]
+async def test_find_many_sort(shared_collection: Collection):
+    collection = shared_collection
+    values = [i for i in range(10)]
 
-    docs = await collection.find_many(sort=SON([('a', -1)]))
-    assert sorted(values, reverse=True) == [doc['a'] for doc in docs]
+    docs1, docs2, docs3 = await asyncio.gather(
+        collection.find_many(sort={'a': 1}),
+        collection.find_many(sort={'a': -1}),
+        collection.find_many(sort=SON([('a', -1)])),
+    )
+    assert sorted(values) == [doc['a'] for doc in docs1]
+    assert sorted(values, reverse=True) == [doc['a'] for doc in docs2]
+    assert sorted(values, reverse=True) == [doc['a'] for doc in docs3]
 
 
 @pytest.mark.asyncio
-async def test_find_many_skip_take(db: Database):
-    collection = db['test_find_many_skip_take']
+async def test_find_many_skip_take(shared_collection: Collection):
+    collection = shared_collection
 
-    total = 10
     skip = 3
     limit = 5
 
-    values = [i for i in range(total)]
-    await collection.insert_many([{'a': i} for i in values])
+    values = [i for i in range(10)]
 
     docs = await collection.find_many(sort={'a': 1}, skip=skip, limit=limit)
     assert sorted(values)[skip : skip + limit] == [doc['a'] for doc in docs]
 
 
 @pytest.mark.asyncio
-async def test_find_many_filter(db: Database):
-    collection = db['test_find_many_filter']
+async def test_find_many_filter(shared_collection: Collection):
+    collection = shared_collection
 
     values = [i for i in range(10)]
-    await collection.insert_many([{'a': i} for i in values])
 
     docs = await collection.find_many(filter={'a': {'$gt': 5}}, sort={'a': 1})
     assert sorted([v for v in values if v > 5]) == [doc['a'] for doc in docs]
 
 
 @pytest.mark.asyncio
-async def test_find_sort(db: Database):
-    collection = db['test_find_sort']
-    values = [i for i in range(5)]
-    await collection.insert_many([{'a': i} for i in values])
+async def test_find_sort(shared_collection: Collection):
+    collection = shared_collection
+    values = [i for i in range(10)]
 
     docs = await collection.find(sort={'a': 1})
     assert sorted(values) == [doc['a'] async for doc in docs]
@@ -98,43 +102,78 @@ async def test_find_sort(db: Database):
 
 
 @pytest.mark.asyncio
-async def test_find_skip_take(db: Database):
-    collection = db['test_find_skip_take']
+async def test_find_skip_take(shared_collection: Collection):
+    collection = shared_collection
 
-    total = 10
     skip = 3
     limit = 5
 
-    values = [i for i in range(total)]
-    await collection.insert_many([{'a': i} for i in values])
+    values = [i for i in range(10)]
 
     docs = await collection.find(sort={'a': 1}, skip=skip, limit=limit)
-    assert sorted(values)[skip : skip + limit] == [doc['a'] async for doc in docs]
+    assert sorted(values)[skip : skip + limit] == [
+        doc['a'] for doc in await docs.to_list()
+    ]
 
 
 @pytest.mark.asyncio
-async def test_find_filter(db: Database):
-    collection = db['test_find_filter']
+async def test_find_fetch_batch(shared_collection: Collection):
+    collection = shared_collection
 
     values = [i for i in range(10)]
+
+    cursor = await collection.find(sort={'a': 1})
+    assert values == [doc['a'] for doc in await cursor.fetch_batch()]
+    assert await cursor.fetch_batch() == []
+
+
+@pytest.mark.asyncio
+async def test_find_prefetch(db: Database):
+    collection = db['test_find_prefetch']
+
+    # more than one (default sized) batch, so the next batch gets prefetched
+    values = [i for i in range(300)]
     await collection.insert_many([{'a': i} for i in values])
 
+    docs = await collection.find(sort={'a': 1})
+    assert values == [doc['a'] async for doc in docs]
+
+    cursor = await collection.find(sort={'a': 1})
+    assert (await cursor.__anext__())['a'] == 0
+    assert values[1:] == [doc['a'] for doc in await cursor.to_list()]
+
+    cursor = await collection.find(sort={'a': 1})
+    async for _ in cursor:
+        break
+    await cursor.close()
+    assert [doc async for doc in cursor] == []
+    assert await cursor.fetch_batch() == []
+    assert await cursor.to_list() == []
+
+
+@pytest.mark.asyncio
+async def test_find_filter(shared_collection: Collection):
+    collection = shared_collection
+
+    values = [i for i in range(10)]
+
     docs = await collection.find(filter={'a': {'$gt': 5}}, sort={'a': 1})
-    assert sorted([v for v in values if v > 5]) == [doc['a'] async for doc in docs]
+    assert sorted([v for v in values if v > 5]) == [
+        doc['a'] for doc in await docs.to_list()
+    ]
 
 
 @pytest.mark.asyncio
 async def test_find_filter_by_regex(db: Database):
     collection = db['test_find_filter_by_regex']
 
-    values = ['Foo', 'Bar', 'Baz', 'Qux', 'Fred']
-    await collection.insert_many([{'a': i} for i in values])
+    await collection.insert_many([{'a': v} for v in _REGEX_VALUES])
 
     docs = await collection.find(filter={'a': {'$regex': '^Ba'}})
-    assert len([doc['a'] async for doc in docs]) == 2
+    assert len(await docs.to_list()) == 2
 
-    docs = await collection.find(filter={'a': re.compile(r'^ba', re.IGNORECASE)})
-    assert len([doc['a'] async for doc in docs]) == 2
+    docs = await collection.find(filter={'a': _CASE_INSENSITIVE_BA})
+    assert len(await docs.to_list()) == 2
 
 
 @pytest.mark.asyncio
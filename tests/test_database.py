@@ -10,6 +10,21 @@ def test_get_database(client: Client):
 
     assert db1.name == db2.name == db3.name == db_name
     assert db1.client is db2.client is db3.client
+    assert client[db_name] is db2
+    assert client.db_name is db2
+
+
+def test_get_collection(db: Database):
+    col_name = 'col_name'
+    col1 = db[col_name]
+    col2 = db.col_name
+    col3 = db.get_collection(col_name)
+
+    assert col1.name == col_name
+    assert col1 is col2 is col3
+
+    col4 = db.get_collection(col_name, read_concern=ReadConcern(level='local'))
+    assert col4 is not col1
 
 
 def test_database_options(client: Client):
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from bson import ObjectId
 
@@ -15,17 +17,32 @@ async def test_gridfs(db: Database):
     res = await bucket.put(data=file_data, filename=file_name, file_id=file_id)
     assert res['file_id'] == file_id
 
-    data = await bucket.get_by_id(file_id=file_id)
-    assert data == file_data
+    data1, data2 = await asyncio.gather(
+        bucket.get_by_id(file_id=file_id),
+        bucket.get_by_name(filename=file_name),
+    )
+    assert data1 == file_data
+    assert data2 == file_data
 
-    data = await bucket.get_by_name(filename=file_name)
-    assert data == file_data
+    chunks = [chunk async for chunk in bucket.open_download_stream(file_id, 5)]
+    assert [len(chunk) for chunk in chunks] == [5, 5, 2]
+    assert b''.join(chunks) == file_data
 
-    with pytest.raises(NoFile):
-        await bucket.get_by_id(file_id=ObjectId())
+    for chunk_size in (0, 16 * 1024 * 1024 + 1):
+        with pytest.raises(ValueError):
+            async for _ in bucket.open_download_stream(file_id, chunk_size):
+                pass
+
+    errors = await asyncio.gather(
+        bucket.get_by_id(file_id=ObjectId()),
+        bucket.get_by_name(filename='qqqqqqqqqqq'),
+        return_exceptions=True,
+    )
+    assert all(isinstance(e, NoFile) for e in errors)
 
     with pytest.raises(NoFile):
-        await bucket.get_by_name(filename='qqqqqqqqqqq')
+        async for _ in bucket.open_download_stream(file_id=ObjectId()):
+            pass
 
     with pytest.raises(FileExists):
         await bucket.put(data=file_data, filename=file_name, file_id=file_id)
@@ -33,3 +50,37 @@ async def test_gridfs(db: Database):
     await bucket.delete(file_id=file_id)
     with pytest.raises(NoFile):
         await bucket.get_by_id(file_id=file_id)
+
+
+@pytest.mark.asyncio
+async def test_gridfs_generated_id(db: Database):
+    bucket: GridfsBucket = db.gridfs_bucket(bucket_name="files")
+
+    file_data = b'file content'
+    res = await bucket.put(data=file_data)
+    assert isinstance(res['file_id'], ObjectId)
+
+    data = await bucket.get_by_id(file_id=res['file_id'])
+    assert data == file_data
+
+
+@pytest.mark.asyncio
+async def test_gridfs_put_buffer(db: Database):
+    bucket: GridfsBucket = db.gridfs_bucket(bucket_name="files")
+
+    file_data = b'file content'
+    for data in (bytearray(file_data), memoryview(file_data)):
+        res = await bucket.put(data=data)
+        assert await bucket.get_by_id(file_id=res['file_id']) == file_data
+
+    # a writable buffer is copied, so changing it during the upload is harmless
+    data = bytearray(file_data)
+    task = asyncio.ensure_future(bucket.put(data=data))
+    await asyncio.sleep(0)
+    data[:] = b'x' * len(data)
+    res = await task
+    assert await bucket.get_by_id(file_id=res['file_id']) == file_data
+
+    # downloaded content can be uploaded again as it is
+    res = await bucket.put(data=await bucket.get_by_id(file_id=res['file_id']))
+    assert await bucket.get_by_id(file_id=res['file_id']) == file_data
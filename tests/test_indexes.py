@@ -1,11 +1,14 @@
-from typing import Optional
+from typing import List, Optional
 
 import pytest
 from mongojet import Database, IndexModel, IndexModelDef, Collection, OperationFailure
 
 
-async def get_index_by_name(c: Collection, name: str) -> Optional[IndexModelDef]:
-    indexes = await c.list_indexes()
+async def get_index_by_name(
+    c: Collection, name: str, indexes: Optional[List[IndexModelDef]] = None
+) -> Optional[IndexModelDef]:
+    if indexes is None:
+        indexes = await c.list_indexes()
     indexes = [i for i in indexes if i['name'] == name]
     if indexes:
         return indexes[0]
@@ -16,26 +19,31 @@ async def get_index_by_name(c: Collection, name: str) -> Optional[IndexModelDef]
 async def test_create_index(db: Database):
     col_name = 'test_create_index'
     collection = db[col_name]
+    keys = [
+        'field_name',
+        {'field_name': -1},
+        {'field1': 1, 'field2': -1},
+        [('field11', 1), ('field22', -1)],
+    ]
+    expected = [
+        {'field_name': 1},
+        {'field_name': -1},
+        {'field1': 1, 'field2': -1},
+        {'field11': 1, 'field22': -1},
+    ]
+
+    res = await collection.create_indexes([IndexModel(keys=key) for key in keys])
+    assert res['index_names'] == [
+        'field_name_1',
+        'field_name_-1',
+        'field1_1_field2_-1',
+        'field11_1_field22_-1',
+    ]
 
-    #
-    res = await collection.create_index('field_name')
-    index = await get_index_by_name(collection, res['index_name'])
-    assert index['key'] == {'field_name': 1}
-
-    #
-    res = await collection.create_index({'field_name': -1})
-    index = await get_index_by_name(collection, res['index_name'])
-    assert index['key'] == {'field_name': -1}
-
-    #
-    res = await collection.create_index({'field1': 1, 'field2': -1})
-    index = await get_index_by_name(collection, res['index_name'])
-    assert index['key'] == {'field1': 1, 'field2': -1}
-
-    #
-    res = await collection.create_index([('field11', 1), ('field22', -1)])
-    index = await get_index_by_name(collection, res['index_name'])
-    assert index['key'] == {'field11': 1, 'field22': -1}
+    indexes = await collection.list_indexes()
+    for name, key in zip(res['index_names'], expected):
+        index = await get_index_by_name(collection, name, indexes=indexes)
+        assert index['key'] == key
 
     ###
     await collection.drop_indexes()
@@ -70,6 +78,26 @@ async def test_create_index_with_options(db: Database):
     assert index['sparse'] == sparse
 
 
+@pytest.mark.asyncio
+async def test_create_index_with_command_options(db: Database):
+    col_name = 'test_create_index_with_command_options'
+    collection = db[col_name]
+
+    res = await collection.create_index(
+        'x',
+        writeConcern={'w': 1},
+        comment='c',
+        maxTimeMS=10000,
+    )
+    assert res['index_name'] == 'x_1'
+
+    # command options are not part of the index definition
+    index = await get_index_by_name(collection, res['index_name'])
+    assert index['key'] == {'x': 1}
+    assert 'writeConcern' not in index
+    assert 'comment' not in index
+
+
 @pytest.mark.asyncio
 async def test_create_partial_index(db: Database):
     col_name = 'test_create_partial_index'
@@ -183,12 +211,17 @@ async def test_create_indexes(db: Database):
     assert 'idx1' in res['index_names']
     assert 'idx2' in res['index_names']
 
-    idx1 = await get_index_by_name(collection, name='idx1')
+    indexes = await collection.list_indexes()
+
+    idx1 = await get_index_by_name(collection, name='idx1', indexes=indexes)
     assert idx1['key'] == {'key': 1}
     assert idx1['unique'] is True
     assert idx1['expireAfterSeconds'] == 3600
     assert idx1['background'] is True
 
+    idx2 = await get_index_by_name(collection, name='idx2', indexes=indexes)
+    assert idx2['key'] == {'key1': 1, 'key2': -1}
+
 
 @pytest.mark.asyncio
 async def test_create_index_error(db: Database):
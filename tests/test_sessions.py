@@ -1,6 +1,6 @@
 import pytest
 
-from mongojet import Database, DuplicateKeyError
+from mongojet import Database, DuplicateKeyError, OperationFailure
 
 
 @pytest.mark.asyncio
@@ -22,3 +22,26 @@ async def test_transaction(db: Database):
             await collection.insert_one({'a': 3}, session=session)
 
     assert await collection.count_documents() == 2
+
+
+@pytest.mark.asyncio
+async def test_transaction_write_conflict(db: Database):
+    collection = db['test_transaction_write_conflict']
+    res = await collection.insert_one({'a': 1})
+    inserted_id = res['inserted_id']
+
+    session1 = await db.client.start_session()
+    session2 = await db.client.start_session()
+
+    async with await session1.start_transaction():
+        await collection.update_one(
+            {'_id': inserted_id}, {'$set': {'a': 2}}, session=session1
+        )
+        with pytest.raises(OperationFailure) as exc_info:
+            async with await session2.start_transaction():
+                await collection.update_one(
+                    {'_id': inserted_id}, {'$set': {'a': 3}}, session=session2
+                )
+
+    assert exc_info.value.code == 112  # WriteConflict
+    assert 'TransientTransactionError' in exc_info.value.labels